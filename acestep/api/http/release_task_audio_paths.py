@@ -2,14 +2,63 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import tempfile
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from fastapi import HTTPException
 from starlette.datastructures import UploadFile as StarletteUploadFile
 
+# Upstream chunks (128 KiB from Starlette, 1 MiB from ``iter_upload_chunks``) are
+# coalesced up to this size so each worker-thread hop performs one large write.
+_WRITE_BATCH_BYTES = 4 * 1024 * 1024
+
+# ``..`` component markers, matched against ``normpath`` output without splitting it.
+_PARENT_PREFIX = os.pardir + os.sep
+_PARENT_INFIX = os.sep + os.pardir + os.sep
+_PARENT_SUFFIX = os.sep + os.pardir
+
+
+@lru_cache(maxsize=8)
+def _temp_roots(temp_dir: str) -> tuple[str, str]:
+    """Return resolved and unresolved spellings of the temp directory, cached per value.
+
+    Callers pass ``tempfile.gettempdir()`` on each use, so nothing is fixed at import
+    time and a ``TMPDIR`` configured later by the lifespan runtime is still honored,
+    while ``realpath`` runs only once per distinct temp directory.
+
+    Args:
+        temp_dir: Current temp directory as reported by ``tempfile.gettempdir()``.
+
+    Returns:
+        Tuple of ``(realpath, abspath)``; the latter matches ``mkstemp`` paths on
+        platforms where the temp dir is a symlink (for example macOS).
+    """
+
+    return os.path.realpath(temp_dir), os.path.abspath(temp_dir)
+
+
+def _is_under(path: str, root: str) -> bool:
+    """Return whether ``path`` equals ``root`` or lies beneath it, without filesystem access.
+
+    Args:
+        path: Absolute path to test.
+        root: Absolute directory path acting as the containment boundary.
+
+    Returns:
+        ``True`` when ``path`` is ``root`` or a descendant of it.
+    """
+
+    path = os.path.normcase(path)
+    root = os.path.normcase(root)
+    if path == root or path.startswith(root + os.sep):
+        return True
+    return os.path.altsep is not None and path.startswith(root + os.path.altsep)
+
 
 def validate_audio_path(path: Optional[str]) -> Optional[str]:
     """Validate user-supplied audio path and block unsafe filesystem traversal.
@@ -27,30 +76,67 @@ def validate_audio_path(path: Optional[str]) -> Optional[str]:
     if not path:
         return None
 
-    system_temp = os.path.realpath(tempfile.gettempdir())
-    requested_path = os.path.realpath(path)
-    try:
-        is_in_temp = os.path.commonpath([system_temp, requested_path]) == system_temp
-    except ValueError:
-        is_in_temp = False
+    system_temp, raw_temp = _temp_roots(tempfile.gettempdir())
+    # Absolute paths that cannot be in temp are rejected before ``realpath`` touches disk.
+    if os.path.isabs(path) and not (_is_under(path, system_temp) or _is_under(path, raw_temp)):
+        raise HTTPException(status_code=400, detail="absolute audio file paths are not allowed")
 
-    if is_in_temp:
+    requested_path = os.path.realpath(path)
+    if _is_under(requested_path, system_temp):
         return requested_path
 
     if os.path.isabs(path):
         raise HTTPException(status_code=400, detail="absolute audio file paths are not allowed")
 
     normalized = os.path.normpath(path)
-    if ".." in normalized.split(os.sep):
+    if (
+        normalized == os.pardir
+        or normalized.startswith(_PARENT_PREFIX)
+        or normalized.endswith(_PARENT_SUFFIX)
+        or _PARENT_INFIX in normalized
+    ):
         raise HTTPException(status_code=400, detail="path traversal in audio file paths is not allowed")
     return path
 
 
-async def save_upload_to_temp(upload: StarletteUploadFile, *, prefix: str) -> str:
-    """Persist uploaded audio file to a temporary location.
+async def iter_upload_chunks(
+    upload: StarletteUploadFile, chunk_size: int = 1024 * 1024
+) -> AsyncIterator[bytes]:
+    """Yield body chunks from an uploaded file and close it once consumed.
 
     Args:
         upload: Uploaded file wrapper from Starlette/FastAPI.
+        chunk_size: Maximum number of bytes requested per read.
+
+    Yields:
+        Non-empty byte chunks in upload order.
+    """
+
+    try:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        with suppress(Exception):
+            await upload.close()
+
+
+async def save_upload_to_temp(
+    chunks: AsyncIterator[bytes], filename: Optional[str], *, prefix: str
+) -> str:
+    """Persist an uploaded audio byte stream to a temporary location.
+
+    ``chunks`` may be ``iter_upload_chunks(upload)`` for multipart files or
+    ``request.stream()`` for raw bodies, which avoids spooling the payload twice.
+    Chunks are batched into writes of about ``_WRITE_BATCH_BYTES`` that run in a
+    worker thread, so large uploads neither block the event loop nor issue one
+    ``write()`` per small chunk.
+
+    Args:
+        chunks: Async iterator producing the uploaded bytes.
+        filename: Client-supplied filename used only to derive the temp-file suffix.
         prefix: Filename prefix used for the temporary file.
 
     Returns:
@@ -60,25 +146,27 @@ async def save_upload_to_temp(upload: StarletteUploadFile, *, prefix: str) -> st
         Exception: Re-raises write errors after cleaning up partial files.
     """
 
-    suffix = Path(upload.filename or "").suffix
+    suffix = Path(filename or "").suffix
     fd, path = tempfile.mkstemp(prefix=f"{prefix}_", suffix=suffix)
-    os.close(fd)
     try:
-        with open(path, "wb") as file_obj:
-            while True:
-                chunk = await upload.read(1024 * 1024)
-                if not chunk:
-                    break
-                file_obj.write(chunk)
+        # Write through the descriptor mkstemp already opened instead of reopening by
+        # path. The file is short-lived scratch data, so it is never fsync'ed.
+        with os.fdopen(fd, "wb") as file_obj:
+            pending = bytearray()
+            async for chunk in chunks:
+                pending += chunk
+                if len(pending) >= _WRITE_BATCH_BYTES:
+                    batch, pending = pending, bytearray()
+                    await asyncio.to_thread(file_obj.write, batch)
+            if pending:
+                await asyncio.to_thread(file_obj.write, pending)
     except Exception:
-        try:
+        with suppress(Exception):
             os.remove(path)
-        except Exception:
-            pass
         raise
     finally:
-        try:
-            await upload.close()
-        except Exception:
-            pass
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            with suppress(Exception):
+                await aclose()
     return path
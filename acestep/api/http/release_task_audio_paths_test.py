@@ -2,12 +2,20 @@
 
 import asyncio
 import os
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
 from unittest import mock
 
 from fastapi import HTTPException
 
-from acestep.api.http.release_task_audio_paths import save_upload_to_temp, validate_audio_path
+from acestep.api.http.release_task_audio_paths import (
+    iter_upload_chunks,
+    save_upload_to_temp,
+    validate_audio_path,
+)
 
 
 class _FakeUpload:
@@ -48,6 +56,34 @@ class ReleaseTaskAudioPathsTests(unittest.TestCase):
         self.assertEqual(400, ctx.exception.status_code)
         self.assertIn("absolute audio file paths are not allowed", str(ctx.exception.detail))
 
+    def test_validate_audio_path_rejects_outside_absolute_path_without_resolving(self):
+        """Validator should reject absolute non-temp paths before calling ``realpath``."""
+
+        fake_temp = os.path.abspath(os.path.join(os.sep, "srv", "tmp"))
+        with mock.patch(
+            "acestep.api.http.release_task_audio_paths._temp_roots",
+            return_value=(fake_temp, fake_temp),
+        ), mock.patch(
+            "acestep.api.http.release_task_audio_paths.os.path.realpath"
+        ) as realpath_mock:
+            with self.assertRaises(HTTPException):
+                validate_audio_path(os.path.abspath(os.path.join(os.sep, "srv", "tmpfoo", "a.wav")))
+        realpath_mock.assert_not_called()
+
+    def test_validate_audio_path_rejects_temp_prefixed_escape(self):
+        """Validator should reject temp-prefixed absolute paths that resolve outside temp."""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            resolved_temp = os.path.realpath(temp_dir)
+            escape = os.path.join(temp_dir, "..", "outside.wav")
+            with mock.patch(
+                "acestep.api.http.release_task_audio_paths._temp_roots",
+                return_value=(resolved_temp, os.path.abspath(temp_dir)),
+            ):
+                with self.assertRaises(HTTPException) as ctx:
+                    validate_audio_path(escape)
+        self.assertIn("absolute audio file paths are not allowed", str(ctx.exception.detail))
+
     def test_validate_audio_path_rejects_traversal_sequences(self):
         """Validator should reject relative paths containing traversal markers."""
 
@@ -56,6 +92,65 @@ class ReleaseTaskAudioPathsTests(unittest.TestCase):
         self.assertEqual(400, ctx.exception.status_code)
         self.assertIn("path traversal", str(ctx.exception.detail))
 
+    def test_validate_audio_path_accepts_path_inside_system_temp(self):
+        """Validator should resolve and accept absolute paths under the cached temp directory."""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            resolved_temp = os.path.realpath(temp_dir)
+            candidate = os.path.join(temp_dir, "clip.wav")
+            with mock.patch(
+                "acestep.api.http.release_task_audio_paths._temp_roots",
+                return_value=(resolved_temp, os.path.abspath(temp_dir)),
+            ):
+                self.assertEqual(
+                    os.path.join(resolved_temp, "clip.wav"),
+                    validate_audio_path(candidate),
+                )
+
+    def test_validate_audio_path_honors_tmpdir_configured_after_import(self):
+        """Validator should accept ``mkstemp`` paths from a ``TMPDIR`` set after import."""
+
+        with tempfile.TemporaryDirectory() as configured_tmp:
+            with mock.patch.dict(os.environ, {"TMPDIR": configured_tmp}), mock.patch.object(
+                tempfile, "tempdir", None
+            ):
+                fd, path = tempfile.mkstemp(suffix=".wav")
+                os.close(fd)
+                self.assertTrue(
+                    os.path.realpath(path).startswith(os.path.realpath(configured_tmp) + os.sep)
+                )
+                self.assertEqual(os.path.realpath(path), validate_audio_path(path))
+
+    def test_import_does_not_pin_tempfile_tempdir(self):
+        """Importing the module must leave ``tempfile.tempdir`` unset for later configuration."""
+
+        code = (
+            "import tempfile\n"
+            "import acestep.api.http.release_task_audio_paths\n"
+            "print(tempfile.tempdir)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+        )
+        self.assertEqual("None", result.stdout.strip())
+
+    def test_validate_audio_path_rejects_collapsed_traversal(self):
+        """Validator should reject paths whose normalized form still climbs above cwd."""
+
+        with self.assertRaises(HTTPException) as ctx:
+            validate_audio_path(os.path.join("clips", "..", "..", "unsafe.wav"))
+        self.assertIn("path traversal", str(ctx.exception.detail))
+
+    def test_validate_audio_path_allows_dots_inside_component_names(self):
+        """Validator should not mistake ``..`` inside a filename for a traversal marker."""
+
+        path = os.path.join("clips", "take..2.wav")
+        self.assertEqual(path, validate_audio_path(path))
+
     def test_save_upload_to_temp_writes_file_and_closes_upload(self):
         """Uploader helper should stream bytes through mocked file writes and close upload."""
 
@@ -63,18 +158,114 @@ class ReleaseTaskAudioPathsTests(unittest.TestCase):
         with mock.patch(
             "acestep.api.http.release_task_audio_paths.tempfile.mkstemp",
             return_value=(123, "mock/path/sample.wav"),
-        ), mock.patch("acestep.api.http.release_task_audio_paths.os.close") as close_mock, mock.patch(
-            "acestep.api.http.release_task_audio_paths.open",
+        ), mock.patch(
+            "acestep.api.http.release_task_audio_paths.os.fdopen",
             new_callable=mock.mock_open,
         ) as open_mock:
-            saved_path = asyncio.run(save_upload_to_temp(upload, prefix="ref_audio"))
+            saved_path = asyncio.run(
+                save_upload_to_temp(iter_upload_chunks(upload), upload.filename, prefix="ref_audio")
+            )
 
         self.assertEqual("mock/path/sample.wav", saved_path)
-        close_mock.assert_called_once_with(123)
-        open_mock.assert_called_once_with("mock/path/sample.wav", "wb")
+        open_mock.assert_called_once_with(123, "wb")
         open_mock().write.assert_called_once_with(b"abc123")
         self.assertTrue(upload.closed)
 
+    def test_save_upload_to_temp_offloads_writes_from_event_loop_thread(self):
+        """Uploader helper should perform blocking file writes outside the event-loop thread."""
+
+        upload = _FakeUpload(payload=b"abc123", filename="sample.wav")
+        write_threads = []
+        file_obj = mock.MagicMock()
+        file_obj.write.side_effect = lambda _chunk: write_threads.append(threading.get_ident())
+        open_mock = mock.MagicMock()
+        open_mock.return_value.__enter__.return_value = file_obj
+        with mock.patch(
+            "acestep.api.http.release_task_audio_paths.tempfile.mkstemp",
+            return_value=(123, "mock/path/sample.wav"),
+        ), mock.patch(
+            "acestep.api.http.release_task_audio_paths.os.fdopen",
+            open_mock,
+        ):
+            asyncio.run(
+                save_upload_to_temp(iter_upload_chunks(upload), upload.filename, prefix="ref_audio")
+            )
+
+        self.assertEqual(1, len(write_threads))
+        self.assertNotEqual(threading.get_ident(), write_threads[0])
+
+    def test_save_upload_to_temp_removes_partial_file_on_stream_error(self):
+        """Uploader helper should delete the temp file and re-raise when the stream fails."""
+
+        async def _stream():
+            """Yield one chunk, then fail like a dropped client connection."""
+
+            yield b"abc"
+            raise ConnectionError("client disconnected")
+
+        with mock.patch(
+            "acestep.api.http.release_task_audio_paths.tempfile.mkstemp",
+            return_value=(123, "mock/path/sample.wav"),
+        ), mock.patch(
+            "acestep.api.http.release_task_audio_paths.os.fdopen",
+            new_callable=mock.mock_open,
+        ) as open_mock, mock.patch(
+            "acestep.api.http.release_task_audio_paths.os.remove"
+        ) as remove_mock:
+            with self.assertRaises(ConnectionError):
+                asyncio.run(save_upload_to_temp(_stream(), "clip.wav", prefix="ref_audio"))
+
+        open_mock().__exit__.assert_called_once()
+        remove_mock.assert_called_once_with("mock/path/sample.wav")
+
+    def test_save_upload_to_temp_accepts_raw_byte_stream(self):
+        """Uploader helper should persist raw request-stream chunks using the given filename."""
+
+        async def _stream():
+            """Yield chunks the way ``Request.stream()`` does."""
+
+            yield b"abc"
+            yield b"123"
+
+        with mock.patch(
+            "acestep.api.http.release_task_audio_paths.tempfile.mkstemp",
+            return_value=(123, "mock/path/sample.flac"),
+        ) as mkstemp_mock, mock.patch(
+            "acestep.api.http.release_task_audio_paths.os.fdopen",
+            new_callable=mock.mock_open,
+        ) as open_mock:
+            saved_path = asyncio.run(save_upload_to_temp(_stream(), "song.flac", prefix="ctx_audio"))
+
+        self.assertEqual("mock/path/sample.flac", saved_path)
+        mkstemp_mock.assert_called_once_with(prefix="ctx_audio_", suffix=".flac")
+        open_mock().write.assert_called_once_with(b"abc123")
+
+    def test_save_upload_to_temp_flushes_batches_at_threshold(self):
+        """Uploader helper should coalesce chunks and flush once the batch size is reached."""
+
+        async def _stream():
+            """Yield small chunks that straddle the patched batch size."""
+
+            for chunk in (b"ab", b"cd", b"ef", b"g"):
+                yield chunk
+
+        with mock.patch(
+            "acestep.api.http.release_task_audio_paths._WRITE_BATCH_BYTES",
+            4,
+        ), mock.patch(
+            "acestep.api.http.release_task_audio_paths.tempfile.mkstemp",
+            return_value=(123, "mock/path/sample.wav"),
+        ), mock.patch(
+            "acestep.api.http.release_task_audio_paths.os.fdopen",
+            new_callable=mock.mock_open,
+        ) as open_mock:
+            asyncio.run(save_upload_to_temp(_stream(), "clip.wav", prefix="ref_audio"))
+
+        self.assertEqual(
+            [mock.call(b"abcd"), mock.call(b"efg")],
+            open_mock().write.call_args_list,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
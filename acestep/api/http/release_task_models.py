@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from acestep.constants import DEFAULT_DIT_INSTRUCTION
 
@@ -16,6 +16,9 @@ class GenerateMusicRequest(BaseModel):
     clients remain compatible while route handling is decomposed.
     """
 
+    # Pydantic v2 spelling of the legacy ``allow_population_by_field_name`` flag.
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", validate_default=False)
+
     prompt: str = Field(default="", description="Text prompt describing the music (local/per-track description for lego SFT)")
     global_caption: str = Field(default="", description="Global song description for SFT-stems lego tasks (full song context)")
     lyrics: str = Field(default="", description="Lyric text")
@@ -123,9 +126,3 @@ class GenerateMusicRequest(BaseModel):
     lm_top_p: Optional[float] = 0.9
     lm_repetition_penalty: float = 1.0
     lm_negative_prompt: str = "NO USER INPUT"
-
-    class Config:
-        """Legacy pydantic config preserving prior population semantics."""
-
-        allow_population_by_field_name = True
-        allow_population_by_alias = True
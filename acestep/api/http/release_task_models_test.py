@@ -33,6 +33,14 @@ class ReleaseTaskModelsTests(unittest.TestCase):
         self.assertEqual("<|audio_code_1|>", req.audio_code_string)
         self.assertAlmostEqual(0.75, req.cover_noise_strength)
 
+    def test_model_config_uses_pydantic_v2_keys(self):
+        """Model config should use v2 keys and ignore unknown request fields."""
+
+        self.assertTrue(GenerateMusicRequest.model_config["populate_by_name"])
+        req = GenerateMusicRequest(prompt="drums", not_a_field="ignored")
+        self.assertEqual("drums", req.prompt)
+        self.assertFalse(hasattr(req, "not_a_field"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,79 @@
+"""Raw-body audio upload helpers for the ``/release_task`` route.
+
+A raw upload sends the audio file itself as the request body (``audio/*`` or
+``application/octet-stream`` with an ``X-Filename`` header) and the remaining
+request fields as query parameters. The body is streamed straight to a temp file,
+so Starlette's multipart parser never spools it to disk first.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from fastapi import HTTPException, Request
+
+# Upload target selected by ``X-Audio-Field`` -> request-model path field it fills.
+RAW_AUDIO_FIELDS = {"ref_audio": "reference_audio_path", "ctx_audio": "src_audio_path"}
+
+
+def is_raw_audio_upload(content_type: str, headers: Mapping[str, str]) -> bool:
+    """Return whether a request body is a raw audio file rather than a field payload.
+
+    Args:
+        content_type: Lower-cased ``Content-Type`` header value.
+        headers: Request headers used to look up ``X-Filename``.
+
+    Returns:
+        ``True`` for ``audio/*`` bodies and ``application/octet-stream`` bodies that
+        name their file via ``X-Filename``.
+    """
+
+    if content_type.startswith("audio/"):
+        return True
+    return content_type.startswith("application/octet-stream") and bool(headers.get("x-filename"))
+
+
+async def save_raw_audio_upload(
+    request: Request,
+    values: Dict[str, Any],
+    validate_audio_path: Callable[[Optional[str]], Optional[str]],
+    save_upload_to_temp: Callable[..., Any],
+) -> Tuple[Dict[str, Optional[str]], str]:
+    """Stream a raw audio body to a temp file and resolve both audio-path fields.
+
+    Args:
+        request: Incoming request whose body is the audio file.
+        values: Query-parameter values carrying the non-file request fields.
+        validate_audio_path: Validator for the manual audio-path field not uploaded.
+        save_upload_to_temp: Helper persisting an async byte stream to a temp path.
+
+    Returns:
+        Tuple of ``(audio_paths, temp_path)`` where ``audio_paths`` holds the
+        ``reference_audio_path`` and ``src_audio_path`` overrides and the uploaded
+        field points at ``temp_path``.
+
+    Raises:
+        HTTPException: If ``X-Audio-Field`` names an unknown field or a manual path
+            is rejected (both checked before any bytes are written).
+    """
+
+    field = (request.headers.get("x-audio-field") or "ref_audio").strip().lower()
+    if field not in RAW_AUDIO_FIELDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"X-Audio-Field must be one of: {', '.join(RAW_AUDIO_FIELDS)}",
+        )
+
+    paths = {
+        "reference_audio_path": validate_audio_path(
+            str(values.get("ref_audio_path") or values.get("reference_audio_path") or "").strip() or None
+        ),
+        "src_audio_path": validate_audio_path(
+            str(values.get("ctx_audio_path") or values.get("src_audio_path") or "").strip() or None
+        ),
+    }
+    temp_path = await save_upload_to_temp(
+        request.stream(), request.headers.get("x-filename"), prefix=field
+    )
+    paths[RAW_AUDIO_FIELDS[field]] = temp_path
+    return paths, temp_path
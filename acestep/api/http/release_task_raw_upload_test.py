@@ -0,0 +1,64 @@
+"""Unit tests for raw-body audio upload helpers used by ``/release_task``."""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from fastapi import HTTPException
+
+from acestep.api.http.release_task_raw_upload import is_raw_audio_upload, save_raw_audio_upload
+
+
+class ReleaseTaskRawUploadTests(unittest.TestCase):
+    """Behavior tests for raw-body detection and streaming persistence."""
+
+    def test_is_raw_audio_upload_detects_supported_bodies(self):
+        """Audio types always qualify; octet-stream qualifies only with ``X-Filename``."""
+
+        self.assertTrue(is_raw_audio_upload("audio/wav", {}))
+        self.assertTrue(is_raw_audio_upload("application/octet-stream", {"x-filename": "a.wav"}))
+        self.assertFalse(is_raw_audio_upload("application/octet-stream", {}))
+        self.assertFalse(is_raw_audio_upload("application/json", {"x-filename": "a.wav"}))
+
+    def test_save_raw_audio_upload_keeps_manual_path_for_other_field(self):
+        """Uploaded body should fill its field while the other field keeps its query path."""
+
+        save_mock = mock.AsyncMock(return_value="/tmp/ref_audio_1.flac")
+        stream = object()
+        request = SimpleNamespace(
+            headers={"x-filename": "song.flac"},
+            stream=lambda: stream,
+        )
+
+        paths, temp_path = asyncio.run(
+            save_raw_audio_upload(
+                request,
+                {"src_audio_path": "clips/source.wav"},
+                lambda path: path,
+                save_mock,
+            )
+        )
+
+        save_mock.assert_awaited_once_with(stream, "song.flac", prefix="ref_audio")
+        self.assertEqual("/tmp/ref_audio_1.flac", temp_path)
+        self.assertEqual(
+            {"reference_audio_path": "/tmp/ref_audio_1.flac", "src_audio_path": "clips/source.wav"},
+            paths,
+        )
+
+    def test_save_raw_audio_upload_rejects_unknown_field_before_writing(self):
+        """Unknown ``X-Audio-Field`` values should fail with 400 and write nothing."""
+
+        save_mock = mock.AsyncMock()
+        request = SimpleNamespace(headers={"x-audio-field": "lyrics"}, stream=lambda: None)
+
+        with self.assertRaises(HTTPException) as ctx:
+            asyncio.run(save_raw_audio_upload(request, {}, lambda path: path, save_mock))
+
+        self.assertEqual(400, ctx.exception.status_code)
+        save_mock.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
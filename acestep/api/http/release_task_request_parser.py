@@ -9,6 +9,8 @@ from typing import Any, Callable, Dict, Optional, Tuple
 
 from fastapi import HTTPException, Request
 
+from acestep.api.http.release_task_audio_paths import iter_upload_chunks
+from acestep.api.http.release_task_raw_upload import is_raw_audio_upload, save_raw_audio_upload
 from acestep.api.http.release_task_request_builder import build_generate_music_request
 
 
@@ -110,7 +112,9 @@ async def parse_release_task_request(
             ref_upload = form.get("ref_audio") or form.get("reference_audio")
             ctx_upload = form.get("ctx_audio") or form.get("src_audio")
             if isinstance(ref_upload, upload_file_type):
-                reference_audio_path = await save_upload_to_temp(ref_upload, prefix="ref_audio")
+                reference_audio_path = await save_upload_to_temp(
+                    iter_upload_chunks(ref_upload), ref_upload.filename, prefix="ref_audio"
+                )
                 temp_files.append(reference_audio_path)
             else:
                 reference_audio_path = validate_audio_path(
@@ -118,7 +122,9 @@ async def parse_release_task_request(
                 )
 
             if isinstance(ctx_upload, upload_file_type):
-                src_audio_path = await save_upload_to_temp(ctx_upload, prefix="ctx_audio")
+                src_audio_path = await save_upload_to_temp(
+                    iter_upload_chunks(ctx_upload), ctx_upload.filename, prefix="ctx_audio"
+                )
                 temp_files.append(src_audio_path)
             else:
                 src_audio_path = validate_audio_path(
@@ -156,6 +162,22 @@ async def parse_release_task_request(
         )
         return req, temp_files
 
+    if is_raw_audio_upload(content_type, request.headers):
+        query_values = dict(request.query_params)
+        verify_token_from_request(query_values, authorization)
+        audio_paths, temp_path = await save_raw_audio_upload(
+            request, query_values, validate_audio_path, save_upload_to_temp
+        )
+        temp_files.append(temp_path)
+        try:
+            return _build(request_parser_cls(query_values), **audio_paths), temp_files
+        except Exception:
+            try:
+                os.remove(temp_path)
+            except Exception:
+                pass
+            raise
+
     raw = await request.body()
     raw_stripped = raw.lstrip()
     if raw_stripped.startswith(b"{") or raw_stripped.startswith(b"["):
@@ -200,6 +222,7 @@ async def parse_release_task_request(
         status_code=415,
         detail=(
             f"Unsupported Content-Type: {content_type or '(missing)'}; "
-            "use application/json, application/x-www-form-urlencoded, or multipart/form-data"
+            "use application/json, application/x-www-form-urlencoded, multipart/form-data, "
+            "or a raw audio/* body"
         ),
     )
@@ -19,10 +19,10 @@ class _FakeParser:
 
         self._values = values
 
-    def get(self, key: str):
+    def get(self, key: str, default=None):
         """Return raw value for ``key`` from parser payload."""
 
-        return self._values.get(key)
+        return self._values.get(key, default)
 
     def str(self, key: str, default: str = "") -> str:
         """Return string value for ``key`` with default fallback."""
@@ -62,10 +62,13 @@ class _FakeRequest:
         json_error: Exception | None = None,
         form_data=None,
         raw_body: bytes = b"",
+        headers: dict | None = None,
+        query_params: dict | None = None,
     ) -> None:
         """Initialize request payloads for targeted parser-path tests."""
 
-        self.headers = {"content-type": content_type}
+        self.headers = {"content-type": content_type, **(headers or {})}
+        self.query_params = query_params or {}
         self._json_data = json_data
         self._json_error = json_error
         self._form_data = form_data
@@ -88,6 +91,11 @@ class _FakeRequest:
 
         return self._raw_body
 
+    async def stream(self):
+        """Yield raw request bytes the way ``Request.stream()`` does."""
+
+        yield self._raw_body
+
 
 class ReleaseTaskRequestParserTests(unittest.TestCase):
     """Behavior tests for low-level parsing helper used by `/release_task`."""
@@ -190,6 +198,8 @@ class ReleaseTaskRequestParserTests(unittest.TestCase):
         class _Upload:
             """Minimal upload marker type for multipart form branch."""
 
+            filename = "clip.wav"
+
             def read(self):
                 """Expose read attribute for file-like filtering."""
 
@@ -225,7 +235,7 @@ class ReleaseTaskRequestParserTests(unittest.TestCase):
 
                 return self._values.get(key)
 
-        async def _save_upload_to_temp(_upload, *, prefix: str) -> str:
+        async def _save_upload_to_temp(_chunks, _filename, *, prefix: str) -> str:
             """Return deterministic temp file path for uploaded payload."""
 
             return f"/tmp/{prefix}_123.wav"
@@ -261,6 +271,84 @@ class ReleaseTaskRequestParserTests(unittest.TestCase):
         self.assertEqual(400, ctx.exception.status_code)
         remove_mock.assert_called_once_with("/tmp/ref_audio_123.wav")
 
+    def test_raw_audio_body_is_streamed_to_temp_with_query_fields(self):
+        """Raw audio bodies should stream to temp and take other fields from the query."""
+
+        saved = {}
+
+        async def _save_upload_to_temp(chunks, filename, *, prefix: str) -> str:
+            """Consume the body stream and record how the helper was called."""
+
+            saved["body"] = b"".join([chunk async for chunk in chunks])
+            saved["filename"] = filename
+            saved["prefix"] = prefix
+            return "/tmp/ctx_audio_123.wav"
+
+        request = _FakeRequest(
+            "audio/wav",
+            raw_body=b"RIFFdata",
+            headers={"x-filename": "take.wav", "x-audio-field": "ctx_audio"},
+            query_params={"prompt": "cover it", "task_type": "cover"},
+        )
+
+        req, temp_files = asyncio.run(
+            parse_release_task_request(
+                request=request,
+                authorization=None,
+                verify_token_from_request=lambda *_: None,
+                request_parser_cls=_FakeParser,
+                request_model_cls=lambda **kwargs: SimpleNamespace(**kwargs),
+                validate_audio_path=lambda path: path,
+                save_upload_to_temp=_save_upload_to_temp,
+                upload_file_type=type("Upload", (), {}),
+                default_dit_instruction="instruction",
+                lm_default_temperature=0.85,
+                lm_default_cfg_scale=2.5,
+                lm_default_top_p=0.9,
+            )
+        )
+
+        self.assertEqual(
+            {"body": b"RIFFdata", "filename": "take.wav", "prefix": "ctx_audio"},
+            saved,
+        )
+        self.assertEqual("/tmp/ctx_audio_123.wav", req.src_audio_path)
+        self.assertIsNone(req.reference_audio_path)
+        self.assertEqual("cover it", req.prompt)
+        self.assertEqual(["/tmp/ctx_audio_123.wav"], temp_files)
+
+    def test_raw_audio_body_requires_auth_before_writing(self):
+        """Raw audio uploads should be rejected by token checks before any bytes are saved."""
+
+        save_mock = mock.AsyncMock(return_value="/tmp/ref_audio_123.wav")
+
+        def _reject(*_args) -> None:
+            """Reject every token check."""
+
+            raise HTTPException(status_code=401, detail="Unauthorized")
+
+        request = _FakeRequest("audio/mpeg", raw_body=b"ID3", headers={"x-filename": "a.mp3"})
+        with self.assertRaises(HTTPException) as ctx:
+            asyncio.run(
+                parse_release_task_request(
+                    request=request,
+                    authorization=None,
+                    verify_token_from_request=_reject,
+                    request_parser_cls=_FakeParser,
+                    request_model_cls=lambda **kwargs: SimpleNamespace(**kwargs),
+                    validate_audio_path=lambda path: path,
+                    save_upload_to_temp=save_mock,
+                    upload_file_type=type("Upload", (), {}),
+                    default_dit_instruction="instruction",
+                    lm_default_temperature=0.85,
+                    lm_default_cfg_scale=2.5,
+                    lm_default_top_p=0.9,
+                )
+            )
+
+        self.assertEqual(401, ctx.exception.status_code)
+        save_mock.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
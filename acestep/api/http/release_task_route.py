@@ -78,7 +78,7 @@ def register_release_task_route(
                 app.state.job_temp_files[record.job_id] = temp_files
 
         async with app.state.pending_lock:
-            app.state.pending_ids.append(record.job_id)
+            app.state.pending_ids.add(record.job_id)
             position = len(app.state.pending_ids)
 
         await queue_ref.put((record.job_id, req))
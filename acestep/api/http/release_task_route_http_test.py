@@ -19,10 +19,10 @@ class _FakeParser:
 
         self._values = values
 
-    def get(self, key: str):
+    def get(self, key: str, default=None):
         """Return raw value for ``key`` from parser payload."""
 
-        return self._values.get(key)
+        return self._values.get(key, default)
 
     def str(self, key: str, default: str = "") -> str:
         """Return string value for ``key`` with default fallback."""
@@ -69,13 +69,13 @@ class _FakeStore:
 class ReleaseTaskRouteHttpTests(unittest.TestCase):
     """Integration tests covering real HTTP calls for `/release_task`."""
 
-    def _build_client(self, queue_maxsize: int = 8) -> TestClient:
+    def _build_client(self, queue_maxsize: int = 8, save_upload_to_temp=None) -> TestClient:
         """Build app and register release-task route with deterministic fakes."""
 
         app = FastAPI()
         app.state.job_queue = asyncio.Queue(maxsize=queue_maxsize)
         app.state.job_temp_files = {}
-        app.state.pending_ids = []
+        app.state.pending_ids = set()
         app.state.job_temp_files_lock = asyncio.Lock()
         app.state.pending_lock = asyncio.Lock()
         store = _FakeStore()
@@ -108,7 +108,7 @@ class ReleaseTaskRouteHttpTests(unittest.TestCase):
             request_parser_cls=_FakeParser,
             request_model_cls=lambda **kwargs: SimpleNamespace(**kwargs),
             validate_audio_path=lambda path: path,
-            save_upload_to_temp=lambda *_args, **_kwargs: "",
+            save_upload_to_temp=save_upload_to_temp or (lambda *_args, **_kwargs: ""),
             upload_file_type=type("Upload", (), {}),
             default_dit_instruction="default-instruction",
             lm_default_temperature=0.85,
@@ -160,6 +160,34 @@ class ReleaseTaskRouteHttpTests(unittest.TestCase):
         self.assertEqual(415, response.status_code)
         self.assertIn("Unsupported Content-Type", response.json()["detail"])
 
+    def test_release_task_streams_raw_audio_body(self):
+        """POST /release_task with an audio body should stream it without multipart parsing."""
+
+        saved = {}
+
+        async def _save_upload_to_temp(chunks, filename, *, prefix: str) -> str:
+            """Consume the request stream and record the persisted upload."""
+
+            saved["body"] = b"".join([chunk async for chunk in chunks])
+            saved["filename"] = filename
+            saved["prefix"] = prefix
+            return "/tmp/ref_audio_1.wav"
+
+        client = self._build_client(save_upload_to_temp=_save_upload_to_temp)
+        response = client.post(
+            "/release_task",
+            params={"ai_token": "test-token", "prompt": "hello"},
+            headers={"Content-Type": "application/octet-stream", "X-Filename": "ref.wav"},
+            content=b"RIFF" + b"\x00" * 64,
+        )
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("queued", response.json()["data"]["status"])
+        self.assertEqual(
+            {"body": b"RIFF" + b"\x00" * 64, "filename": "ref.wav", "prefix": "ref_audio"},
+            saved,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
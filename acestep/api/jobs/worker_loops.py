@@ -3,55 +3,61 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import Any, Awaitable, Callable
 
 
 async def process_queue_item(
     job_id: str,
     req: Any,
-    app_state: Any,
+    app_state: Any,  # .pending_ids: set[str]
     store: Any,
     run_one_job: Callable[[str, Any], Awaitable[None]],
     cleanup_job_temp_files: Callable[[str], Awaitable[None]],
 ) -> None:
     """Process one queued job item and notify waiters.
 
+    Terminal progress events are coalesced into a single list put on
+    ``rec.progress_queue`` (for example ``[result, done]``).
+
     Args:
         job_id: Job identifier from queue.
         req: Request payload associated with the job.
-        app_state: App state containing queue and pending-id synchronization.
+        app_state: App state containing queue and pending-id synchronization;
+            ``app_state.pending_ids`` must be a ``set[str]``.
         store: Job store exposing `get(job_id)` and `mark_failed(job_id, error)`.
         run_one_job: Async callable that executes one job.
         cleanup_job_temp_files: Async callable to cleanup temporary upload files.
     """
 
     rec = store.get(job_id)
+    # Waiter channels are attached before the job is queued, so read them once.
+    progress_queue = getattr(rec, "progress_queue", None)
+    done_event = getattr(rec, "done_event", None)
     try:
         async with app_state.pending_lock:
-            try:
-                app_state.pending_ids.remove(job_id)
-            except ValueError:
-                pass
+            app_state.pending_ids.discard(job_id)
 
         await run_one_job(job_id, req)
 
-        if rec and rec.progress_queue:
+        if progress_queue:
+            events: list[dict[str, Any]] = []
             if rec.status == "succeeded" and rec.result:
-                await rec.progress_queue.put({"type": "result", "result": rec.result})
+                events.append({"type": "result", "result": rec.result})
             elif rec.status == "failed":
-                await rec.progress_queue.put({"type": "error", "content": rec.error or "Generation failed"})
-            await rec.progress_queue.put({"type": "done"})
-        if rec and rec.done_event:
-            rec.done_event.set()
+                events.append({"type": "error", "content": rec.error or "Generation failed"})
+            events.append({"type": "done"})
+            await progress_queue.put(events)
+        if done_event:
+            done_event.set()
 
     except Exception as exc:
         if rec and rec.status not in ("succeeded", "failed"):
             store.mark_failed(job_id, str(exc))
-        if rec and rec.progress_queue:
-            await rec.progress_queue.put({"type": "error", "content": str(exc)})
-            await rec.progress_queue.put({"type": "done"})
-        if rec and rec.done_event:
-            rec.done_event.set()
+        if progress_queue:
+            await progress_queue.put([{"type": "error", "content": str(exc)}, {"type": "done"}])
+        if done_event:
+            done_event.set()
     finally:
         await cleanup_job_temp_files(job_id)
         app_state.job_queue.task_done()
@@ -62,12 +68,30 @@ async def run_job_store_cleanup_loop(
     cleanup_interval_seconds: int,
     sleep_fn: Callable[[float], Awaitable[None]] = asyncio.sleep,
     log_fn: Callable[[str], None] = print,
+    clock_fn: Callable[[], float] = time.monotonic,
 ) -> None:
-    """Periodically cleanup completed jobs until cancelled."""
+    """Periodically cleanup completed jobs until cancelled.
+
+    Ticks follow a fixed deadline schedule, so cleanup duration does not stretch the
+    period. Ticks missed during a long stall (for example system suspend) are skipped
+    rather than replayed back to back.
+
+    Args:
+        store: Job store exposing ``cleanup_old_jobs()`` and ``get_stats()``.
+        cleanup_interval_seconds: Target period between cleanup ticks.
+        sleep_fn: Async sleep used to wait for the next deadline.
+        log_fn: Logger for cleanup summaries and errors.
+        clock_fn: Monotonic clock used to compute deadlines.
+    """
 
+    next_tick = clock_fn() + cleanup_interval_seconds
     while True:
         try:
-            await sleep_fn(cleanup_interval_seconds)
+            await sleep_fn(max(0.0, next_tick - clock_fn()))
+            next_tick += cleanup_interval_seconds
+            now = clock_fn()
+            if next_tick <= now:
+                next_tick = now + cleanup_interval_seconds
             removed = store.cleanup_old_jobs()
             if removed > 0:
                 stats = store.get_stats()
@@ -34,7 +34,7 @@ class WorkerLoopTests(unittest.TestCase):
             store = _FakeStore(record=record)
             app_state = SimpleNamespace(
                 pending_lock=asyncio.Lock(),
-                pending_ids=["job-1"],
+                pending_ids={"job-1"},
                 job_queue=_FakeJobQueue(),
             )
             cleanup_calls = []
@@ -59,12 +59,14 @@ class WorkerLoopTests(unittest.TestCase):
                 cleanup_job_temp_files=_cleanup_job_temp_files,
             )
 
-            msg1 = await progress_queue.get()
-            msg2 = await progress_queue.get()
-            self.assertEqual({"type": "result", "result": {"job_id": "job-1", "ok": True}}, msg1)
-            self.assertEqual({"type": "done"}, msg2)
+            events = await progress_queue.get()
+            self.assertEqual(
+                [{"type": "result", "result": {"job_id": "job-1", "ok": True}}, {"type": "done"}],
+                events,
+            )
+            self.assertTrue(progress_queue.empty())
             self.assertTrue(done_event.was_set)
-            self.assertEqual([], app_state.pending_ids)
+            self.assertEqual(set(), app_state.pending_ids)
             self.assertEqual(["job-1"], cleanup_calls)
             self.assertEqual(1, app_state.job_queue.task_done_calls)
 
@@ -88,7 +90,7 @@ class WorkerLoopTests(unittest.TestCase):
             store = _FakeStore(record=record)
             app_state = SimpleNamespace(
                 pending_lock=asyncio.Lock(),
-                pending_ids=["job-2"],
+                pending_ids={"job-2"},
                 job_queue=_FakeJobQueue(),
             )
             cleanup_calls = []
@@ -112,18 +114,53 @@ class WorkerLoopTests(unittest.TestCase):
                 cleanup_job_temp_files=_cleanup_job_temp_files,
             )
 
-            msg1 = await progress_queue.get()
-            msg2 = await progress_queue.get()
-            self.assertEqual({"type": "error", "content": "boom"}, msg1)
-            self.assertEqual({"type": "done"}, msg2)
+            events = await progress_queue.get()
+            self.assertEqual([{"type": "error", "content": "boom"}, {"type": "done"}], events)
+            self.assertTrue(progress_queue.empty())
             self.assertTrue(done_event.was_set)
             self.assertEqual([("job-2", "boom")], store.mark_failed_calls)
-            self.assertEqual([], app_state.pending_ids)
+            self.assertEqual(set(), app_state.pending_ids)
             self.assertEqual(["job-2"], cleanup_calls)
             self.assertEqual(1, app_state.job_queue.task_done_calls)
 
         asyncio.run(_run())
 
+    def test_process_queue_item_tolerates_missing_record(self):
+        """Missing store records should still run the job and release queue bookkeeping."""
+
+        async def _run() -> None:
+            """Process a job whose record has already been evicted from the store."""
+
+            app_state = SimpleNamespace(
+                pending_lock=asyncio.Lock(),
+                pending_ids={"job-3"},
+                job_queue=_FakeJobQueue(),
+            )
+            ran = []
+
+            async def _run_one_job(job_id: str, _req) -> None:
+                """Record job execution for assertion."""
+
+                ran.append(job_id)
+
+            async def _cleanup_job_temp_files(_job_id: str) -> None:
+                """No-op cleanup for this scenario."""
+
+            await process_queue_item(
+                job_id="job-3",
+                req=SimpleNamespace(),
+                app_state=app_state,
+                store=_FakeStore(record=None),
+                run_one_job=_run_one_job,
+                cleanup_job_temp_files=_cleanup_job_temp_files,
+            )
+
+            self.assertEqual(["job-3"], ran)
+            self.assertEqual(set(), app_state.pending_ids)
+            self.assertEqual(1, app_state.job_queue.task_done_calls)
+
+        asyncio.run(_run())
+
     def test_run_job_store_cleanup_loop_logs_cleanup_and_stops_on_cancel(self):
         """Cleanup loop should log cleanup stats and exit on cancellation."""
 
@@ -188,6 +225,50 @@ class WorkerLoopTests(unittest.TestCase):
 
         asyncio.run(_run())
 
+    def test_run_job_store_cleanup_loop_keeps_fixed_deadline_schedule(self):
+        """Cleanup loop should subtract cleanup time from the next sleep and skip missed ticks."""
+
+        async def _run() -> None:
+            """Drive the loop with a fake clock that advances during cleanup and stalls."""
+
+            clock = {"now": 100.0}
+            sleeps = []
+            store = _FakeStore()
+            original_cleanup = store.cleanup_old_jobs
+
+            def _slow_cleanup() -> int:
+                """Advance the fake clock as if cleanup took two seconds."""
+
+                clock["now"] += 2.0
+                return original_cleanup()
+
+            store.cleanup_old_jobs = _slow_cleanup
+
+            async def _sleep_fn(seconds: float) -> None:
+                """Record requested delay, stall once, then cancel on the fourth tick."""
+
+                sleeps.append(seconds)
+                if len(sleeps) == 2:
+                    clock["now"] += 50.0
+                elif len(sleeps) == 4:
+                    raise asyncio.CancelledError
+                else:
+                    clock["now"] += seconds
+
+            await run_job_store_cleanup_loop(
+                store=store,
+                cleanup_interval_seconds=10,
+                sleep_fn=_sleep_fn,
+                log_fn=lambda _line: None,
+                clock_fn=lambda: clock["now"],
+            )
+
+            # 10s first tick, 8s after 2s cleanup, then a 50s stall resets the schedule.
+            self.assertEqual([10.0, 8.0, 8.0], sleeps[:3])
+            self.assertEqual(3, store.cleanup_call_count)
+
+        asyncio.run(_run())
+
 
 if __name__ == "__main__":
     unittest.main()
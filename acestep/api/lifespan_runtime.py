@@ -116,7 +116,7 @@ def initialize_lifespan_runtime(
     executor = ThreadPoolExecutor(max_workers=max_workers)
 
     app.state.job_queue = asyncio.Queue(maxsize=queue_maxsize)
-    app.state.pending_ids = deque()
+    app.state.pending_ids = set()
     app.state.pending_lock = asyncio.Lock()
     app.state.job_temp_files = {}
     app.state.job_temp_files_lock = asyncio.Lock()
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import os
+from types import MappingProxyType
+from typing import Optional
 
 
-MODEL_REPO_MAPPING = {
+# Read-only view: the mapping is static configuration shared by every caller.
+MODEL_REPO_MAPPING = MappingProxyType({
     "acestep-v15-turbo": "ACE-Step/Ace-Step1.5",
     "acestep-5Hz-lm-1.7B": "ACE-Step/Ace-Step1.5",
     "vae": "ACE-Step/Ace-Step1.5",
@@ -15,25 +18,54 @@ MODEL_REPO_MAPPING = {
     "acestep-v15-base": "ACE-Step/acestep-v15-base",
     "acestep-v15-sft": "ACE-Step/acestep-v15-sft",
     "acestep-v15-turbo-shift3": "ACE-Step/acestep-v15-turbo-shift3",
-}
+})
 
 DEFAULT_REPO_ID = "ACE-Step/Ace-Step1.5"
 
+DEFAULT_DOWNLOAD_WORKERS = 16
+HF_ETAG_TIMEOUT_SECONDS = 30
+
+
+def get_download_workers() -> int:
+    """Return parallel file-download workers from ``ACESTEP_DOWNLOAD_WORKERS``.
+
+    Returns:
+        Positive worker count, falling back to ``DEFAULT_DOWNLOAD_WORKERS`` for
+        missing or invalid values.
+    """
+
+    try:
+        workers = int(os.environ.get("ACESTEP_DOWNLOAD_WORKERS", DEFAULT_DOWNLOAD_WORKERS))
+    except ValueError:
+        return DEFAULT_DOWNLOAD_WORKERS
+    return workers if workers > 0 else DEFAULT_DOWNLOAD_WORKERS
+
+
+# ``True`` once Google has answered a probe; failures are never cached.
+_GOOGLE_REACHABLE: Optional[bool] = None
+
 
 def can_access_google(timeout: float = 3.0) -> bool:
-    """Check if Google is reachable to select preferred model source."""
+    """Check if Google is reachable to select preferred model source.
+
+    ``socket.create_connection`` tries every resolved address (IPv6 and IPv4), so
+    dual-stack hosts with broken IPv4 routes are not misreported as offline. Only
+    a successful probe is cached, so a transient network failure is retried (with
+    the caller's ``timeout``) on the next download instead of pinning ModelScope.
+    """
 
+    global _GOOGLE_REACHABLE
     import socket
 
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    try:
-        sock.settimeout(timeout)
-        sock.connect(("www.google.com", 443))
+    if _GOOGLE_REACHABLE:
         return True
-    except (socket.timeout, socket.error, OSError):
+    try:
+        with socket.create_connection(("www.google.com", 443), timeout=timeout):
+            pass
+    except OSError:
         return False
-    finally:
-        sock.close()
+    _GOOGLE_REACHABLE = True
+    return True
 
 
 def download_from_huggingface(repo_id: str, local_dir: str, model_name: str) -> str:
@@ -41,7 +73,7 @@ def download_from_huggingface(repo_id: str, local_dir: str, model_name: str) ->
 
     from huggingface_hub import snapshot_download
 
-    is_unified_repo = repo_id == DEFAULT_REPO_ID or repo_id == "ACE-Step/Ace-Step1.5"
+    is_unified_repo = repo_id == DEFAULT_REPO_ID
 
     if is_unified_repo:
         download_dir = local_dir
@@ -55,6 +87,8 @@ def download_from_huggingface(repo_id: str, local_dir: str, model_name: str) ->
         repo_id=repo_id,
         local_dir=download_dir,
         local_dir_use_symlinks=False,
+        max_workers=get_download_workers(),
+        etag_timeout=HF_ETAG_TIMEOUT_SECONDS,
     )
 
     return os.path.join(local_dir, model_name)
@@ -65,7 +99,7 @@ def download_from_modelscope(repo_id: str, local_dir: str, model_name: str) -> s
 
     from modelscope import snapshot_download
 
-    is_unified_repo = repo_id == DEFAULT_REPO_ID or repo_id == "ACE-Step/Ace-Step1.5"
+    is_unified_repo = repo_id == DEFAULT_REPO_ID
 
     if is_unified_repo:
         download_dir = local_dir
@@ -76,10 +110,18 @@ def download_from_modelscope(repo_id: str, local_dir: str, model_name: str) -> s
         print(f"[Model Download] Downloading {model_name} from ModelScope {repo_id} to {download_dir}...")
 
     try:
-        result_path = snapshot_download(
-            model_id=repo_id,
-            local_dir=download_dir,
-        )
+        try:
+            result_path = snapshot_download(
+                model_id=repo_id,
+                local_dir=download_dir,
+                max_workers=get_download_workers(),
+            )
+        except TypeError:
+            print("[Model Download] Retrying without max_workers parameter...")
+            result_path = snapshot_download(
+                model_id=repo_id,
+                local_dir=download_dir,
+            )
         print(f"[Model Download] ModelScope download completed: {result_path}")
     except TypeError:
         print("[Model Download] Retrying with cache_dir parameter...")
@@ -92,12 +134,26 @@ def download_from_modelscope(repo_id: str, local_dir: str, model_name: str) -> s
     return os.path.join(local_dir, model_name)
 
 
+def _has_entries(path: str) -> bool:
+    """Return whether ``path`` is an existing directory with at least one entry.
+
+    A single ``scandir`` answers both questions, replacing an ``exists`` plus
+    ``listdir`` pair that touched the directory twice.
+    """
+
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except FileNotFoundError:
+        return False
+
+
 def ensure_model_downloaded(model_name: str, checkpoint_dir: str) -> str:
     """Ensure model exists locally, downloading from configured source if missing."""
 
     model_path = os.path.join(checkpoint_dir, model_name)
 
-    if os.path.exists(model_path) and os.listdir(model_path):
+    if _has_entries(model_path):
         print(f"[Model Download] Model {model_name} already exists at {model_path}")
         return model_path
 
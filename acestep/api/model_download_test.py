@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import tempfile
 import types
 import unittest
 from unittest import mock
@@ -29,13 +30,53 @@ class ModelDownloadTests(unittest.TestCase):
             repo_id=model_download.DEFAULT_REPO_ID,
             local_dir="checkpoints",
             local_dir_use_symlinks=False,
+            max_workers=model_download.DEFAULT_DOWNLOAD_WORKERS,
+            etag_timeout=model_download.HF_ETAG_TIMEOUT_SECONDS,
         )
         self.assertEqual(os.path.join("checkpoints", "acestep-v15-turbo"), out)
 
+    def test_download_from_huggingface_forwards_configured_workers(self):
+        """HuggingFace download should forward ACESTEP_DOWNLOAD_WORKERS as max_workers."""
+
+        snapshot_download = mock.Mock(return_value="ok")
+        fake_hf = types.SimpleNamespace(snapshot_download=snapshot_download)
+        with mock.patch.dict("sys.modules", {"huggingface_hub": fake_hf}), mock.patch.dict(
+            os.environ, {"ACESTEP_DOWNLOAD_WORKERS": "32"}, clear=False
+        ):
+            model_download.download_from_huggingface(
+                repo_id=model_download.DEFAULT_REPO_ID,
+                local_dir="checkpoints",
+                model_name="acestep-v15-turbo",
+            )
+
+        self.assertEqual(32, snapshot_download.call_args.kwargs["max_workers"])
+
+    def test_get_download_workers_falls_back_on_invalid_values(self):
+        """Worker count should fall back to the default for non-positive or malformed input."""
+
+        for raw in ("0", "-4", "many"):
+            with self.subTest(raw=raw), mock.patch.dict(
+                os.environ, {"ACESTEP_DOWNLOAD_WORKERS": raw}, clear=False
+            ):
+                self.assertEqual(
+                    model_download.DEFAULT_DOWNLOAD_WORKERS,
+                    model_download.get_download_workers(),
+                )
+
+    def test_model_repo_mapping_is_read_only(self):
+        """Repo mapping should reject mutation while still resolving known models."""
+
+        self.assertEqual(
+            model_download.DEFAULT_REPO_ID,
+            model_download.MODEL_REPO_MAPPING["acestep-v15-turbo"],
+        )
+        with self.assertRaises(TypeError):
+            model_download.MODEL_REPO_MAPPING["custom-model"] = "someone/custom"
+
     def test_download_from_modelscope_retries_with_cache_dir_on_type_error(self):
         """ModelScope download should retry with cache_dir for compatibility."""
 
-        snapshot_download = mock.Mock(side_effect=[TypeError("bad"), "ok"])
+        snapshot_download = mock.Mock(side_effect=[TypeError("bad"), TypeError("bad"), "ok"])
         fake_ms = types.SimpleNamespace(snapshot_download=snapshot_download)
         with mock.patch.dict("sys.modules", {"modelscope": fake_ms}):
             out = model_download.download_from_modelscope(
@@ -44,26 +85,35 @@ class ModelDownloadTests(unittest.TestCase):
                 model_name="acestep-v15-turbo",
             )
 
-        self.assertEqual(2, snapshot_download.call_count)
-        first_call = snapshot_download.call_args_list[0].kwargs
-        second_call = snapshot_download.call_args_list[1].kwargs
+        self.assertEqual(3, snapshot_download.call_count)
+        calls = [call.kwargs for call in snapshot_download.call_args_list]
+        self.assertEqual(
+            {
+                "model_id": model_download.DEFAULT_REPO_ID,
+                "local_dir": "checkpoints",
+                "max_workers": model_download.DEFAULT_DOWNLOAD_WORKERS,
+            },
+            calls[0],
+        )
         self.assertEqual(
             {"model_id": model_download.DEFAULT_REPO_ID, "local_dir": "checkpoints"},
-            first_call,
+            calls[1],
         )
         self.assertEqual(
             {"model_id": model_download.DEFAULT_REPO_ID, "cache_dir": "checkpoints"},
-            second_call,
+            calls[2],
         )
         self.assertEqual(os.path.join("checkpoints", "acestep-v15-turbo"), out)
 
     def test_ensure_model_downloaded_returns_existing_model_path(self):
         """Ensure helper should return existing model path without download attempts."""
 
-        with mock.patch("acestep.api.model_download.os.path.exists", return_value=True), mock.patch(
-            "acestep.api.model_download.os.listdir",
-            return_value=["weights.safetensors"],
-        ), mock.patch("acestep.api.model_download.download_from_huggingface") as hf_mock, mock.patch(
+        with mock.patch(
+            "acestep.api.model_download._has_entries",
+            return_value=True,
+        ), mock.patch(
+            "acestep.api.model_download.download_from_huggingface"
+        ) as hf_mock, mock.patch(
             "acestep.api.model_download.download_from_modelscope"
         ) as ms_mock:
             out = model_download.ensure_model_downloaded("acestep-v15-turbo", "checkpoints")
@@ -72,11 +122,52 @@ class ModelDownloadTests(unittest.TestCase):
         hf_mock.assert_not_called()
         ms_mock.assert_not_called()
 
+    def test_has_entries_distinguishes_missing_empty_and_populated_dirs(self):
+        """Directory probe should be false for missing/empty dirs and true once populated."""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertFalse(model_download._has_entries(os.path.join(temp_dir, "missing")))
+            self.assertFalse(model_download._has_entries(temp_dir))
+            open(os.path.join(temp_dir, "weights.safetensors"), "wb").close()
+            self.assertTrue(model_download._has_entries(temp_dir))
+
+    def test_can_access_google_retries_after_failed_probe(self):
+        """Reachability probe should not cache failures and should honor each timeout."""
+
+        with mock.patch.object(model_download, "_GOOGLE_REACHABLE", None), mock.patch(
+            "socket.create_connection",
+            side_effect=OSError("unreachable"),
+        ) as connect_mock:
+            self.assertFalse(model_download.can_access_google(timeout=0.1))
+            self.assertFalse(model_download.can_access_google(timeout=0.2))
+
+        self.assertEqual(
+            [
+                mock.call(("www.google.com", 443), timeout=0.1),
+                mock.call(("www.google.com", 443), timeout=0.2),
+            ],
+            connect_mock.call_args_list,
+        )
+
+    def test_can_access_google_caches_success_and_closes_socket(self):
+        """Reachability probe should close the probe connection and reuse a success."""
+
+        conn = mock.MagicMock()
+        with mock.patch.object(model_download, "_GOOGLE_REACHABLE", None), mock.patch(
+            "socket.create_connection",
+            return_value=conn,
+        ) as connect_mock:
+            self.assertTrue(model_download.can_access_google())
+            self.assertTrue(model_download.can_access_google())
+
+        connect_mock.assert_called_once()
+        conn.__exit__.assert_called_once()
+
     def test_ensure_model_downloaded_uses_huggingface_when_env_prefers_it(self):
         """Ensure helper should honor explicit HuggingFace preference."""
 
         with mock.patch.dict(os.environ, {"ACESTEP_DOWNLOAD_SOURCE": "huggingface"}, clear=False), mock.patch(
-            "acestep.api.model_download.os.path.exists",
+            "acestep.api.model_download._has_entries",
             return_value=False,
         ), mock.patch(
             "acestep.api.model_download.download_from_huggingface",
@@ -95,7 +186,7 @@ class ModelDownloadTests(unittest.TestCase):
         """Ensure helper should fallback to ModelScope when HuggingFace fails."""
 
         with mock.patch.dict(os.environ, {"ACESTEP_DOWNLOAD_SOURCE": ""}, clear=False), mock.patch(
-            "acestep.api.model_download.os.path.exists",
+            "acestep.api.model_download._has_entries",
             return_value=False,
         ), mock.patch("acestep.api.model_download.can_access_google", return_value=True), mock.patch(
             "acestep.api.model_download.download_from_huggingface",
@@ -114,7 +205,7 @@ class ModelDownloadTests(unittest.TestCase):
         """Ensure helper should fallback to HuggingFace when ModelScope fails."""
 
         with mock.patch.dict(os.environ, {"ACESTEP_DOWNLOAD_SOURCE": ""}, clear=False), mock.patch(
-            "acestep.api.model_download.os.path.exists",
+            "acestep.api.model_download._has_entries",
             return_value=False,
         ), mock.patch("acestep.api.model_download.can_access_google", return_value=False), mock.patch(
             "acestep.api.model_download.download_from_modelscope",
@@ -518,51 +518,59 @@ async def _openrouter_stream_generator(
     # Wait for result with periodic heartbeats
     while True:
         try:
-            msg = await asyncio.wait_for(rec.progress_queue.get(), timeout=2.0)
+            batch = await asyncio.wait_for(rec.progress_queue.get(), timeout=2.0)
         except asyncio.TimeoutError:
             yield _make_chunk(content=".")
             await asyncio.sleep(0)
             continue
 
-        msg_type = msg.get("type")
+        # The queue worker puts terminal events as one list, e.g. [result, done].
+        messages = batch if isinstance(batch, list) else [batch]
+        finished = False
+        for msg in messages:
+            msg_type = msg.get("type")
 
-        if msg_type == "done":
-            break
-
-        elif msg_type == "error":
-            yield _make_chunk(content=f"\n\nError: {msg.get('content', 'Unknown error')}")
-            yield _make_chunk(finish_reason="error")
-            yield "data: [DONE]\n\n"
-            return
+            if msg_type == "done":
+                finished = True
+                break
 
-        elif msg_type == "result":
-            result = msg.get("result", {})
+            elif msg_type == "error":
+                yield _make_chunk(content=f"\n\nError: {msg.get('content', 'Unknown error')}")
+                yield _make_chunk(finish_reason="error")
+                yield "data: [DONE]\n\n"
+                return
 
-            # Send LM content
-            lm_content = _format_lm_content(result)
-            yield _make_chunk(content=f"\n\n{lm_content}")
-            await asyncio.sleep(0)
+            elif msg_type == "result":
+                result = msg.get("result", {})
 
-            # Send audio
-            raw_audio_paths = result.get("raw_audio_paths", [])
-            if raw_audio_paths:
-                audio_path = raw_audio_paths[0]
-                if audio_path and os.path.exists(audio_path):
-                    b64_url = _audio_to_base64_url(audio_path, audio_format)
-                    if b64_url:
-                        audio_list = [{
-                            "type": "audio_url",
-                            "audio_url": {"url": b64_url},
-                        }]
-                        yield _make_chunk(audio=audio_list)
-                        await asyncio.sleep(0)
-
-            # Send audio_codes if available
-            audio_codes = result.get("audio_codes")
-            if audio_codes:
-                yield _make_chunk(content=f"\n\n[audio_codes]{audio_codes}[/audio_codes]")
+                # Send LM content
+                lm_content = _format_lm_content(result)
+                yield _make_chunk(content=f"\n\n{lm_content}")
                 await asyncio.sleep(0)
 
+                # Send audio
+                raw_audio_paths = result.get("raw_audio_paths", [])
+                if raw_audio_paths:
+                    audio_path = raw_audio_paths[0]
+                    if audio_path and os.path.exists(audio_path):
+                        b64_url = _audio_to_base64_url(audio_path, audio_format)
+                        if b64_url:
+                            audio_list = [{
+                                "type": "audio_url",
+                                "audio_url": {"url": b64_url},
+                            }]
+                            yield _make_chunk(audio=audio_list)
+                            await asyncio.sleep(0)
+
+                # Send audio_codes if available
+                audio_codes = result.get("audio_codes")
+                if audio_codes:
+                    yield _make_chunk(content=f"\n\n[audio_codes]{audio_codes}[/audio_codes]")
+                    await asyncio.sleep(0)
+
+        if finished:
+            break
+
     # Finish
     yield _make_chunk(finish_reason="stop")
     yield "data: [DONE]\n\n"
@@ -787,7 +795,7 @@ def create_openrouter_router(app_state_getter) -> APIRouter:
             rec.progress_queue = asyncio.Queue()
 
             async with state.pending_lock:
-                state.pending_ids.append(rec.job_id)
+                state.pending_ids.add(rec.job_id)
 
             await job_queue.put((rec.job_id, gen_request))
 
@@ -800,7 +808,7 @@ def create_openrouter_router(app_state_getter) -> APIRouter:
             rec.done_event = asyncio.Event()
 
             async with state.pending_lock:
-                state.pending_ids.append(rec.job_id)
+                state.pending_ids.add(rec.job_id)
 
             await job_queue.put((rec.job_id, gen_request))
 
@@ -0,0 +1,93 @@
+"""Unit tests for the OpenRouter SSE stream generator's progress-queue handling."""
+
+import asyncio
+import json
+import unittest
+from types import SimpleNamespace
+
+from acestep.openrouter_adapter import _openrouter_stream_generator
+
+
+def _collect_stream(*queue_items):
+    """Run the stream generator over pre-queued items and return its SSE chunks.
+
+    Args:
+        *queue_items: Items to place on ``progress_queue`` before streaming.
+
+    Returns:
+        List of raw SSE strings yielded by the generator.
+    """
+
+    async def _run():
+        """Fill the queue, then drain the generator to completion."""
+
+        queue = asyncio.Queue()
+        for item in queue_items:
+            queue.put_nowait(item)
+        rec = SimpleNamespace(progress_queue=queue)
+        return [chunk async for chunk in _openrouter_stream_generator(rec, "acestep/test", "mp3")]
+
+    return asyncio.run(_run())
+
+
+def _payloads(chunks):
+    """Decode JSON ``data:`` payloads, leaving the ``[DONE]`` sentinel as a string."""
+
+    decoded = []
+    for chunk in chunks:
+        body = chunk[len("data: "):].strip()
+        decoded.append(body if body == "[DONE]" else json.loads(body))
+    return decoded
+
+
+class OpenRouterStreamGeneratorTests(unittest.TestCase):
+    """Behavior tests for unpacking coalesced worker events into SSE chunks."""
+
+    def test_result_then_done_batch_streams_content_and_stops(self):
+        """A ``[result, done]`` batch should emit result content and a ``stop`` finish."""
+
+        payloads = _payloads(
+            _collect_stream(
+                [
+                    {"type": "result", "result": {"prompt": "lofi beat", "audio_codes": "<c1>"}},
+                    {"type": "done"},
+                ]
+            )
+        )
+
+        self.assertEqual("assistant", payloads[0]["choices"][0]["delta"]["role"])
+        contents = [p["choices"][0]["delta"].get("content") for p in payloads[1:-2]]
+        self.assertIn("**Caption:** lofi beat", contents[0])
+        self.assertEqual("\n\n[audio_codes]<c1>[/audio_codes]", contents[1])
+        self.assertEqual("stop", payloads[-2]["choices"][0]["finish_reason"])
+        self.assertEqual("[DONE]", payloads[-1])
+
+    def test_error_then_done_batch_finishes_with_error(self):
+        """An ``[error, done]`` batch should stop at the error without a ``stop`` finish."""
+
+        payloads = _payloads(
+            _collect_stream([{"type": "error", "content": "boom"}, {"type": "done"}])
+        )
+
+        self.assertEqual(4, len(payloads))
+        self.assertEqual("\n\nError: boom", payloads[1]["choices"][0]["delta"]["content"])
+        self.assertEqual("error", payloads[2]["choices"][0]["finish_reason"])
+        self.assertEqual("[DONE]", payloads[3])
+
+    def test_bare_dict_events_are_still_accepted(self):
+        """Single-dict queue items should be handled the same as one-element batches."""
+
+        payloads = _payloads(
+            _collect_stream(
+                {"type": "result", "result": {"prompt": "ambient"}},
+                {"type": "done"},
+            )
+        )
+
+        self.assertIn("**Caption:** ambient", payloads[1]["choices"][0]["delta"]["content"])
+        self.assertEqual("stop", payloads[-2]["choices"][0]["finish_reason"])
+        self.assertEqual("[DONE]", payloads[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()